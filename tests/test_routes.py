@@ -70,8 +70,11 @@ class TestProductRoutes(TestCase):
     def setUp(self):
         """Runs before each test"""
         self.client = app.test_client()
-        db.session.query(Product).delete()  # clean up the last tests
-        db.session.commit()
+        # clean up the last tests, only committing if anything was deleted
+        if db.session.query(Product).delete(synchronize_session=False):
+            db.session.commit()
+        else:
+            db.session.rollback()
 
     def tearDown(self):
         db.session.remove()